@@ -1,106 +1,166 @@
 import csv
+import math
 import os
+import re
+import sys
+import warnings
+from array import array
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Callable, Iterable, List, Tuple, TypeVar
+
+try:
+    import numpy as np
+except ImportError:  # optional; math.fsum is used instead
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # optional; the csv module is used instead
+    pd = None
+
+# Read saved expenses through a 1 MiB buffer to cut read() calls on large files
+READ_BUFFER_SIZE = 1 << 20
+
+CSV_FIELDS = ["date", "category", "amount", "description"]
+
+T = TypeVar("T")
+
+# (dates, categories, amounts, descriptions) as stored on ExpenseTracker
+ExpenseColumns = Tuple[List[str], List[str], array, List[str]]
+
+# Compiled once so date checks on the load path skip strptime entirely
+DATE_PATTERN = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+# Characters that make csv.writer (QUOTE_MINIMAL) quote a field
+QUOTE_TRIGGER = re.compile(r'[,"\r\n]')
+
+
+# Module-level (not a method) so `self` does not end up in the cache key.
+# Expense dates repeat heavily, so most lookups are cache hits.
+@lru_cache(maxsize=4096)
+def _validate_date(date_str: str) -> bool:
+    # Cheap YYYY-MM-DD shape check used on the load path; it does not
+    # reject impossible days such as Feb 30 (see
+    # ExpenseTracker._validate_date_strict)
+    match = DATE_PATTERN.fullmatch(date_str)
+    if match is None:
+        return False
+    return 1 <= int(match[2]) <= 12 and 1 <= int(match[3]) <= 31
+
+
+def _sum_amounts(amounts: array) -> float:
+    # numpy reads the array('d') buffer in place (no copy) and reduces it
+    # in a vectorized C loop
+    if np is not None:
+        return float(np.frombuffer(amounts, dtype=np.float64).sum())
+    return math.fsum(amounts)
+
+
+def _needs_quoting(fields: Iterable[str]) -> bool:
+    return any(map(QUOTE_TRIGGER.search, fields))
+
+
+def _require_text(text: str, label: str) -> str:
+    if not text:
+        raise ValueError(f"{label} cannot be empty.")
+    return text
+
+
+def _parse_positive(text: str, label: str) -> float:
+    try:
+        value = float(text)
+    except ValueError:
+        raise ValueError("Please enter a valid number.") from None
+    if not value > 0:
+        raise ValueError(f"{label} must be positive.")
+    # Amounts are saved with two decimals; round here so an accepted value
+    # is exactly what is written and loaded back
+    value = round(value, 2)
+    if not value > 0:
+        raise ValueError(f"{label} must be at least 0.01.")
+    return value
 
 
 class ExpenseTracker:
 
     def __init__(self, csv_filename: str = "expenses.csv"):
-        self.expenses: List[Dict[str, str]] = []
+        # Expenses are stored column-wise; index i across the four
+        # containers is one expense. Only valid rows are ever stored.
+        self.dates: List[str] = []
+        self.categories: List[str] = []
+        self.amounts: array = array("d")
+        self.descriptions: List[str] = []
+        # Sum of self.amounts, kept up to date so totals are O(1)
+        self._running_total: float = 0.0
+        # True once any stored text field needs csv quoting; until then
+        # save_expenses can skip csv.writer's per-field quote scan
+        self._needs_quoting: bool = False
         self.monthly_budget: float = 0.0
         self.csv_filename = csv_filename
         self.load_expenses()
 
     def add_expense(self) -> None:
         print("\n--- Add New Expense ---")
-        # Get and validate date
-        while True:
-            date_input = input("Enter date (YYYY-MM-DD): ").strip()
-            if self._validate_date(date_input):
-                break
-            print("Invalid date format. Please use YYYY-MM-DD format.")
-
-        # Get category
-        while True:
-            category = input(
-                "Enter category (e.g., Food, Travel, Entertainment): "
-            ).strip()
-            if category:
-                break
-            print("Category cannot be empty.")
-
-        # Get and validate amount
-        while True:
-            try:
-                amount = float(input("Enter amount: ₹").strip())
-                if amount > 0:
-                    break
-                print("Amount must be positive.")
-            except ValueError:
-                print("Please enter a valid number.")
-
-        # Get description
-        while True:
-            description = input("Enter description: ").strip()
-            if description:
-                break
-            print("Description cannot be empty.")
-
-        # Create expense dictionary and add to list
-        expense = {
-            "date": date_input,
-            "category": category,
-            "amount": amount,
-            "description": description,
-        }
+        date_input = self._prompt_until_valid(
+            "Enter date (YYYY-MM-DD): ", self._parse_date_input
+        )
+        category = self._prompt_until_valid(
+            "Enter category (e.g., Food, Travel, Entertainment): ",
+            lambda text: _require_text(text, "Category"),
+        )
+        amount = self._prompt_until_valid(
+            "Enter amount: ₹", lambda text: _parse_positive(text, "Amount")
+        )
+        description = self._prompt_until_valid(
+            "Enter description: ", lambda text: _require_text(text, "Description")
+        )
 
-        self.expenses.append(expense)
+        # Inputs were validated by the prompt loops above
+        # Dates and categories repeat heavily; interning lets equal values
+        # share one str object
+        self.dates.append(sys.intern(date_input))
+        self.categories.append(sys.intern(category))
+        self.amounts.append(amount)
+        self.descriptions.append(description)
+        self._running_total += amount
+        if not self._needs_quoting:
+            self._needs_quoting = _needs_quoting((category, description))
         print(f"✓ Expense of ₹{amount:.2f} for {category} added successfully!")
 
     def view_expenses(self) -> None:
         print("\n--- Your Expenses ---")
 
-        if not self.expenses:
+        if not self.dates:
             print("No expenses recorded yet.")
             return
 
-        # Header
-        print(f"{'Date':<12} {'Category':<15} {'Amount':<10} {'Description':<30}")
-        print("-" * 70)
-
-        valid_expenses = 0
-        total_amount = 0
-
-        for expense in self.expenses:
-            # Validate expense data
-            if self._validate_expense(expense):
-                print(
-                    f"{expense['date']:<12} {expense['category']:<15} "
-                    f"₹{expense['amount']:<9.2f} {expense['description']:<30}"
-                )
-                valid_expenses += 1
-                total_amount += expense["amount"]
-            else:
-                print(f"⚠️  Incomplete expense entry skipped")
+        # Build the whole table and write it once instead of one print per row
+        lines = [
+            f"{'Date':<12} {'Category':<15} {'Amount':<10} {'Description':<30}",
+            "-" * 70,
+        ]
+        lines.extend(
+            f"{expense_date:<12} {category:<15} ₹{amount:<9.2f} {description:<30}"
+            for expense_date, category, amount, description in zip(
+                self.dates, self.categories, self.amounts, self.descriptions
+            )
+        )
+        lines.append("-" * 70)
+        lines.append(f"Total valid expenses: {len(self.dates)}")
+        lines.append(f"Total amount: ₹{self._running_total:.2f}")
 
-        print("-" * 70)
-        print(f"Total valid expenses: {valid_expenses}")
-        print(f"Total amount: ₹{total_amount:.2f}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def set_budget(self) -> None:
         print("\n--- Set Monthly Budget ---")
 
-        while True:
-            try:
-                budget = float(input("Enter your monthly budget: ₹").strip())
-                if budget > 0:
-                    self.monthly_budget = budget
-                    print(f"✓ Monthly budget set to ₹{budget:.2f}")
-                    break
-                print("Budget must be positive.")
-            except ValueError:
-                print("Please enter a valid number.")
+        budget = self._prompt_until_valid(
+            "Enter your monthly budget: ₹", lambda text: _parse_positive(text, "Budget")
+        )
+        self.monthly_budget = budget
+        print(f"✓ Monthly budget set to ₹{budget:.2f}")
 
     def track_budget(self) -> None:
         print("\n--- Budget Tracking ---")
@@ -110,12 +170,8 @@ class ExpenseTracker:
             self.set_budget()
             return
 
-        # Calculate total expenses for valid entries
-        total_expenses = sum(
-            expense["amount"]
-            for expense in self.expenses
-            if self._validate_expense(expense)
-        )
+        # Maintained incrementally by add_expense/load_expenses
+        total_expenses = self._running_total
 
         print(f"Monthly Budget: ₹{self.monthly_budget:.2f}")
         print(f"Total Expenses: ₹{total_expenses:.2f}")
@@ -134,23 +190,32 @@ class ExpenseTracker:
     def save_expenses(self) -> None:
         try:
             with open(self.csv_filename, "w", newline="", encoding="utf-8") as file:
-                if self.expenses:
+                if self.dates:
                     # Write header and data
-                    fieldnames = ["date", "category", "amount", "description"]
-                    writer = csv.DictWriter(file, fieldnames=fieldnames)
-                    writer.writeheader()
-
-                    valid_count = 0
-                    for expense in self.expenses:
-                        if self._validate_expense(expense):
-                            writer.writerow(expense)
-                            valid_count += 1
-
-                    print(f"✓ {valid_count} expenses saved to {self.csv_filename}")
+                    writer = csv.writer(file)
+                    writer.writerow(CSV_FIELDS)
+                    rows = zip(
+                        self.dates, self.categories, self.amounts, self.descriptions
+                    )
+                    if self._needs_quoting:
+                        # writerows iterates inside the csv module's C loop
+                        writer.writerows(
+                            (expense_date, category, f"{amount:.2f}", description)
+                            for expense_date, category, amount, description in rows
+                        )
+                    else:
+                        # Nothing to quote: format the lines directly, using
+                        # the same \r\n terminator csv.writer would
+                        file.writelines(
+                            f"{expense_date},{category},{amount:.2f},{description}\r\n"
+                            for expense_date, category, amount, description in rows
+                        )
+
+                    print(f"✓ {len(self.dates)} expenses saved to {self.csv_filename}")
                 else:
                     # Create empty file with headers
                     writer = csv.writer(file)
-                    writer.writerow(["date", "category", "amount", "description"])
+                    writer.writerow(CSV_FIELDS)
                     print(f"✓ Empty expense file created: {self.csv_filename}")
 
         except Exception as e:
@@ -162,26 +227,126 @@ class ExpenseTracker:
             return
 
         try:
-            with open(self.csv_filename, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                loaded_expenses = []
-
-                for row in reader:
-                    # Convert amount back to float
-                    try:
-                        row["amount"] = float(row["amount"])
-                        loaded_expenses.append(row)
-                    except (ValueError, KeyError) as e:
-                        print(f"⚠️  Skipping invalid row: {e}")
-
-                self.expenses = loaded_expenses
-                print(
-                    f"✓ Loaded {len(self.expenses)} expenses from {self.csv_filename}"
-                )
+            # Both loaders validate every row once, so readers can trust
+            # every stored row and invalid ones never reach the columns
+            load_columns = (
+                self._load_columns_pandas if pd is not None else self._load_columns_csv
+            )
+            columns = load_columns()
+            self.dates, self.categories, self.amounts, self.descriptions = columns
+            self._running_total = _sum_amounts(self.amounts)
+            # Dates are not scanned: only digits-and-dashes dates that fully
+            # match DATE_PATTERN are ever stored, and those need no quoting
+            self._needs_quoting = _needs_quoting(self.categories) or _needs_quoting(
+                self.descriptions
+            )
+            print(f"✓ Loaded {len(self.dates)} expenses from {self.csv_filename}")
 
         except Exception as e:
             print(f"❌ Error loading expenses: {e}")
 
+    def _load_columns_pandas(self) -> ExpenseColumns:
+        # Tokenize with pandas' C parser and validate whole columns at once
+        # instead of calling back into Python for every row
+        try:
+            # The C parser reports rows with too many fields as ParserWarnings
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", pd.errors.ParserWarning)
+                df = pd.read_csv(
+                    self.csv_filename,
+                    # Skip the header by position, as the csv loader does
+                    header=None,
+                    skiprows=1,
+                    names=CSV_FIELDS,
+                    # Never take a row with a fifth field as an index column
+                    index_col=False,
+                    dtype=object,
+                    na_filter=False,
+                    encoding="utf-8",
+                    on_bad_lines="warn",
+                )
+        except (ValueError, TypeError):
+            # ParserError (e.g. an unbalanced quote), EmptyDataError, a decode
+            # error, or a pandas too old for on_bad_lines: the csv loader
+            # copes with all of these row by row
+            return self._load_columns_csv()
+        if any(
+            issubclass(warning.category, pd.errors.ParserWarning) for warning in caught
+        ):
+            # Let the csv loader skip and report malformed rows itself, so
+            # both loaders keep and report exactly the same rows
+            return self._load_columns_csv()
+
+        amount = pd.to_numeric(df["amount"], errors="coerce")
+        # Dates repeat heavily: check each distinct one with the cached
+        # helper and match the column against the good ones in C
+        good_dates = [date for date in df["date"].unique() if _validate_date(date)]
+        valid = (
+            (df["category"] != "")
+            & (df["description"] != "")
+            & df["date"].isin(good_dates)
+            & (amount > 0)
+        )
+
+        for row in df[~valid].itertuples(index=False, name=None):
+            print(f"⚠️  Skipping invalid row: {row}")
+
+        amounts = array("d")
+        amounts.frombytes(amount[valid].to_numpy(dtype=np.float64).tobytes())
+        return (
+            list(map(sys.intern, df["date"][valid].tolist())),
+            list(map(sys.intern, df["category"][valid].tolist())),
+            amounts,
+            df["description"][valid].tolist(),
+        )
+
+    def _load_columns_csv(self) -> ExpenseColumns:
+        dates: List[str] = []
+        categories: List[str] = []
+        amounts = array("d")
+        descriptions: List[str] = []
+
+        with open(
+            self.csv_filename,
+            "r",
+            newline="",
+            encoding="utf-8",
+            buffering=READ_BUFFER_SIZE,
+        ) as file:
+            reader = csv.reader(file)
+            next(reader, None)  # header
+
+            # Validate inline so bad rows are skipped without creating objects
+            for row in reader:
+                # Blank lines are not rows (DictReader and pandas skip them too)
+                if not row:
+                    continue
+                if len(row) != 4 or not (row[1] and row[3] and _validate_date(row[0])):
+                    print(f"⚠️  Skipping invalid row: {row}")
+                    continue
+
+                expense_date, category, amount_text, description = row
+
+                # The only place loaded amounts are converted; once in the
+                # float array they need no further type checks
+                try:
+                    amount = float(amount_text)
+                except ValueError as e:
+                    print(f"⚠️  Skipping invalid row: {e}")
+                    continue
+
+                # Same rule add_expense enforces on input
+                if not amount > 0:
+                    print(f"⚠️  Skipping invalid row: {row}")
+                    continue
+
+                dates.append(sys.intern(expense_date))
+                categories.append(sys.intern(category))
+                amounts.append(amount)
+                descriptions.append(description)
+
+        return dates, categories, amounts, descriptions
+
     def display_menu(self) -> None:
         """
         Display the main menu options.
@@ -229,34 +394,31 @@ class ExpenseTracker:
             except Exception as e:
                 print(f"❌ An error occurred: {e}")
 
-    def _validate_date(self, date_str: str) -> bool:
+    def _prompt_until_valid(self, prompt: str, parse: Callable[[str], T]) -> T:
+        # parse returns the accepted value or raises ValueError with the
+        # message to show; input/print/str.strip are bound locally so the
+        # retry loop does fast local loads instead of global/attr lookups
+        _input, _print, _strip = input, print, str.strip
+        while True:
+            try:
+                return parse(_strip(_input(prompt)))
+            except ValueError as e:
+                _print(e)
+
+    def _parse_date_input(self, text: str) -> str:
+        if not self._validate_date_strict(text):
+            raise ValueError("Invalid date format. Please use YYYY-MM-DD format.")
+        # strptime also accepts unpadded input such as 2024-1-5; store the
+        # zero-padded form, which is what _validate_date accepts on load
+        return datetime.strptime(text, "%Y-%m-%d").date().isoformat()
+
+    def _validate_date_strict(self, date_str: str) -> bool:
         try:
             datetime.strptime(date_str, "%Y-%m-%d")
             return True
         except ValueError:
             return False
 
-    def _validate_expense(self, expense: Dict) -> bool:
-
-        required_fields = ["date", "category", "amount", "description"]
-
-        # Check if all required fields exist and are not empty
-        for field in required_fields:
-            if field not in expense or not expense[field]:
-                return False
-
-        # Validate date format
-        if not self._validate_date(expense["date"]):
-            return False
-
-        # Validate amount is a number
-        try:
-            float(expense["amount"])
-        except (ValueError, TypeError):
-            return False
-
-        return True
-
 
 # Example usage and main execution
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+"""
+JSON Serialization Module
+Encodes and decodes the application's JSON files, using orjson when it is
+installed and the standard library json module otherwise
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the standard library
+    orjson = None
+
+
+def dumps(obj):
+    """
+    Serialize an object to indented JSON
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def loads(data):
+    """
+    Parse a JSON document
+
+    Args:
+        data (bytes): UTF-8 encoded JSON document
+
+    Returns:
+        Parsed object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+            (orjson's error type subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -8,6 +8,13 @@ import sys
 from user import UserAuth
 from task import TaskManager
 
+_CONFIRM_YES = frozenset(("yes", "y"))
+_SUCCESS_PREFIX = "\n✅ "
+_ERROR_PREFIX = "\n❌ "
+
+# Returned by a menu action to leave the menu loop
+_EXIT = object()
+
 
 class TaskManagerApp:
     """Main application class for Task Manager"""
@@ -18,6 +25,25 @@ class TaskManagerApp:
         self.current_user = None
         self.task_manager = None
 
+        # Menu choice -> action, looked up once per loop iteration
+        self._main_actions = {
+            "1": self._do_login,
+            "2": self.register_user,
+            "3": self._do_exit,
+        }
+        self._task_actions = {
+            "1": self.add_task,
+            "2": self.view_all_tasks,
+            "3": self.view_pending_tasks,
+            "4": self.view_completed_tasks,
+            "5": self.search_tasks,
+            "6": self.update_task,
+            "7": self.mark_task_complete,
+            "8": self.mark_task_pending,
+            "9": self.delete_task,
+            "10": self._do_logout,
+        }
+
     def clear_screen(self):
         """Clear the console screen"""
         os.system("clear" if os.name == "posix" else "cls")
@@ -37,6 +63,25 @@ class TaskManagerApp:
         """Print a separator line"""
         print("-" * 60)
 
+    def print_success(self, message):
+        """
+        Print a success message
+
+        Args:
+            message (str): Message to show
+        """
+        # One write with a prebuilt prefix; input() flushes before prompting
+        sys.stdout.write(_SUCCESS_PREFIX + message + "\n")
+
+    def print_error(self, message):
+        """
+        Print an error message
+
+        Args:
+            message (str): Message to show
+        """
+        sys.stdout.write(_ERROR_PREFIX + message + "\n")
+
     def get_input(self, prompt, required=True):
         """
         Get user input with validation
@@ -58,6 +103,23 @@ class TaskManagerApp:
         """Wait for user to press enter"""
         input("\nPress Enter to continue...")
 
+    def _read_task_id(self, prompt):
+        """
+        Read a task ID, reporting non-numeric input
+
+        Args:
+            prompt (str): Input prompt
+
+        Returns:
+            int or None: Task ID, or None if the input was not a number
+        """
+        try:
+            return int(self.get_input(prompt))
+        except ValueError:
+            self.print_error("Invalid Task ID. Please enter a number.")
+            self.press_enter_to_continue()
+            return None
+
     def display_main_menu(self):
         """Display main menu for unauthenticated users"""
         self.clear_screen()
@@ -112,17 +174,17 @@ class TaskManagerApp:
         confirm_password = self.get_input("Confirm password: ")
 
         if password != confirm_password:
-            print("\n❌ Passwords do not match!")
+            self.print_error("Passwords do not match!")
             self.press_enter_to_continue()
             return
 
         success, message = self.auth.register(username, password)
 
         if success:
-            print(f"\n✅ {message}")
+            self.print_success(message)
             print("You can now login with your credentials.")
         else:
-            print(f"\n❌ {message}")
+            self.print_error(message)
 
         self.press_enter_to_continue()
 
@@ -139,20 +201,25 @@ class TaskManagerApp:
         if success:
             self.current_user = username
             self.task_manager = TaskManager(username)
-            print(f"\n✅ {message}")
+            self.print_success(message)
             print(f"Welcome back, {username}!")
             self.press_enter_to_continue()
             return True
         else:
-            print(f"\n❌ {message}")
+            self.print_error(message)
             self.press_enter_to_continue()
             return False
 
     def logout_user(self):
         """Handle user logout"""
+        try:
+            self.task_manager.close()
+        except OSError as e:
+            # Changes stay pending and are retried when the program exits
+            self.print_error(f"Could not save tasks: {e}")
         self.current_user = None
         self.task_manager = None
-        print("\n✅ Logged out successfully!")
+        self.print_success("Logged out successfully!")
         self.press_enter_to_continue()
 
     def add_task(self):
@@ -177,10 +244,10 @@ class TaskManagerApp:
         )
 
         if success:
-            print(f"\n✅ {message}")
+            self.print_success(message)
             print(f"Task ID: {task_id}")
         else:
-            print(f"\n❌ {message}")
+            self.print_error(message)
 
         self.press_enter_to_continue()
 
@@ -290,17 +357,14 @@ class TaskManagerApp:
         self.clear_screen()
         self.print_header("UPDATE TASK")
 
-        try:
-            task_id = int(self.get_input("\nEnter Task ID to update: "))
-        except ValueError:
-            print("\n❌ Invalid Task ID. Please enter a number.")
-            self.press_enter_to_continue()
+        task_id = self._read_task_id("\nEnter Task ID to update: ")
+        if task_id is None:
             return
 
         task = self.task_manager.view_task_by_id(task_id)
 
         if not task:
-            print(f"\n❌ Task with ID {task_id} not found")
+            self.print_error(f"Task with ID {task_id} not found")
             self.press_enter_to_continue()
             return
 
@@ -339,9 +403,9 @@ class TaskManagerApp:
         success, message = self.task_manager.update_task(task_id, **updates)
 
         if success:
-            print(f"\n✅ {message}")
+            self.print_success(message)
         else:
-            print(f"\n❌ {message}")
+            self.print_error(message)
 
         self.press_enter_to_continue()
 
@@ -350,19 +414,16 @@ class TaskManagerApp:
         self.clear_screen()
         self.print_header("MARK TASK AS COMPLETE")
 
-        try:
-            task_id = int(self.get_input("\nEnter Task ID to mark as complete: "))
-        except ValueError:
-            print("\n❌ Invalid Task ID. Please enter a number.")
-            self.press_enter_to_continue()
+        task_id = self._read_task_id("\nEnter Task ID to mark as complete: ")
+        if task_id is None:
             return
 
         success, message = self.task_manager.mark_complete(task_id)
 
         if success:
-            print(f"\n✅ {message}")
+            self.print_success(message)
         else:
-            print(f"\n❌ {message}")
+            self.print_error(message)
 
         self.press_enter_to_continue()
 
@@ -371,19 +432,16 @@ class TaskManagerApp:
         self.clear_screen()
         self.print_header("MARK TASK AS PENDING")
 
-        try:
-            task_id = int(self.get_input("\nEnter Task ID to mark as pending: "))
-        except ValueError:
-            print("\n❌ Invalid Task ID. Please enter a number.")
-            self.press_enter_to_continue()
+        task_id = self._read_task_id("\nEnter Task ID to mark as pending: ")
+        if task_id is None:
             return
 
         success, message = self.task_manager.mark_pending(task_id)
 
         if success:
-            print(f"\n✅ {message}")
+            self.print_success(message)
         else:
-            print(f"\n❌ {message}")
+            self.print_error(message)
 
         self.press_enter_to_continue()
 
@@ -392,17 +450,14 @@ class TaskManagerApp:
         self.clear_screen()
         self.print_header("DELETE TASK")
 
-        try:
-            task_id = int(self.get_input("\nEnter Task ID to delete: "))
-        except ValueError:
-            print("\n❌ Invalid Task ID. Please enter a number.")
-            self.press_enter_to_continue()
+        task_id = self._read_task_id("\nEnter Task ID to delete: ")
+        if task_id is None:
             return
 
         task = self.task_manager.view_task_by_id(task_id)
 
         if not task:
-            print(f"\n❌ Task with ID {task_id} not found")
+            self.print_error(f"Task with ID {task_id} not found")
             self.press_enter_to_continue()
             return
 
@@ -413,36 +468,51 @@ class TaskManagerApp:
             "\nAre you sure you want to delete this task? (yes/no): "
         )
 
-        if confirm.lower() in ["yes", "y"]:
+        if confirm.casefold() in _CONFIRM_YES:
             success, message = self.task_manager.delete_task(task_id)
 
             if success:
-                print(f"\n✅ {message}")
+                self.print_success(message)
             else:
-                print(f"\n❌ {message}")
+                self.print_error(message)
         else:
-            print("\n❌ Task deletion cancelled.")
+            self.print_error("Task deletion cancelled.")
 
         self.press_enter_to_continue()
 
+    def _do_login(self):
+        """Log in and, on success, enter the task menu"""
+        if self.login_user():
+            self.run_task_menu()
+
+    def _do_exit(self):
+        """Say goodbye and exit the application"""
+        self.clear_screen()
+        print("\n👋 Thank you for using Task Manager. Goodbye!")
+        sys.exit(0)
+
+    def _do_logout(self):
+        """
+        Log out and leave the task menu
+
+        Returns:
+            object: _EXIT, so the task menu loop stops
+        """
+        self.logout_user()
+        return _EXIT
+
     def run_main_menu(self):
         """Run the main menu loop for unauthenticated users"""
         while True:
             self.display_main_menu()
             choice = self.get_input("Enter your choice (1-3): ")
 
-            if choice == "1":
-                if self.login_user():
-                    self.run_task_menu()
-            elif choice == "2":
-                self.register_user()
-            elif choice == "3":
-                self.clear_screen()
-                print("\n👋 Thank you for using Task Manager. Goodbye!")
-                sys.exit(0)
-            else:
-                print("\n❌ Invalid choice. Please try again.")
+            action = self._main_actions.get(choice)
+            if action is None:
+                self.print_error("Invalid choice. Please try again.")
                 self.press_enter_to_continue()
+                continue
+            action()
 
     def run_task_menu(self):
         """Run the task menu loop for authenticated users"""
@@ -450,30 +520,13 @@ class TaskManagerApp:
             self.display_task_menu()
             choice = self.get_input("Enter your choice (1-10): ")
 
-            if choice == "1":
-                self.add_task()
-            elif choice == "2":
-                self.view_all_tasks()
-            elif choice == "3":
-                self.view_pending_tasks()
-            elif choice == "4":
-                self.view_completed_tasks()
-            elif choice == "5":
-                self.search_tasks()
-            elif choice == "6":
-                self.update_task()
-            elif choice == "7":
-                self.mark_task_complete()
-            elif choice == "8":
-                self.mark_task_pending()
-            elif choice == "9":
-                self.delete_task()
-            elif choice == "10":
-                self.logout_user()
-                break
-            else:
-                print("\n❌ Invalid choice. Please try again.")
+            action = self._task_actions.get(choice)
+            if action is None:
+                self.print_error("Invalid choice. Please try again.")
                 self.press_enter_to_continue()
+                continue
+            if action() is _EXIT:
+                break
 
     def run(self):
         """Start the application"""
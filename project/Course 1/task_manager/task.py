@@ -5,8 +5,80 @@ Handles CRUD operations for user tasks
 
 import os
 import json
+import time
+import atexit
+import bisect
+import functools
+import threading
+from collections import defaultdict
+from itertools import compress, repeat
+from operator import contains, itemgetter
 from datetime import datetime
 
+import jsonio
+
+_PRIORITIES = frozenset(("Low", "Medium", "High"))
+
+# Seconds to wait after a mutation so a burst of them is saved with one write
+FLUSH_DELAY = 0.1
+
+
+def _clean_title(value):
+    """Strip a title; None (ignored) if it is empty"""
+    return value.strip() or None
+
+
+def _clean_text(value):
+    """Strip an optional text field"""
+    return value.strip()
+
+
+def _clean_priority(value):
+    """Accept a known priority; None (ignored) otherwise"""
+    return value if value in _PRIORITIES else None
+
+
+def _locked(method):
+    """Run a TaskManager method while holding its lock"""
+    # Keeps the flush timer from serializing a half-applied change
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _new_buckets():
+    """Map a field value to a ([task IDs], [tasks]) pair kept in ID order"""
+    return defaultdict(lambda: ([], []))
+
+
+def _bucket_add(buckets, key, task):
+    """Insert a task into its bucket at its ID position"""
+    ids, tasks = buckets[key]
+    i = bisect.bisect(ids, task["id"])
+    ids.insert(i, task["id"])
+    tasks.insert(i, task)
+
+
+def _bucket_remove(buckets, key, task):
+    """Remove a task from its bucket"""
+    ids, tasks = buckets[key]
+    i = bisect.bisect_left(ids, task["id"])
+    del ids[i]
+    del tasks[i]
+
+
+# Fields update_task may change, with the cleaner applied to new values
+_UPDATABLE_FIELDS = (
+    ("title", _clean_title),
+    ("description", _clean_text),
+    ("priority", _clean_priority),
+    ("due_date", _clean_text),
+)
+
 
 class TaskManager:
     """Manage tasks for authenticated users"""
@@ -22,66 +94,225 @@ class TaskManager:
         self.username = username
         self.tasks_dir = tasks_dir
         self.tasks_file = os.path.join(tasks_dir, f"{username}_tasks.json")
+        self._cache = None
+        self._cache_mtime = None
+        self._by_id = {}
+        self._by_status = _new_buckets()
+        self._by_priority = _new_buckets()
+        self._search_blobs = {}
+        self._next_id = None
+        self._ts_cache = (None, "")
+        self._dirty = False
+        self._flush_timer = None
+        self._flush_error = None
+        self._lock = threading.RLock()
         self._ensure_tasks_directory()
         self._ensure_tasks_file()
+        atexit.register(self.flush)
 
     def _ensure_tasks_directory(self):
         """Create tasks directory if it doesn't exist"""
-        if not os.path.exists(self.tasks_dir):
-            os.makedirs(self.tasks_dir)
+        os.makedirs(self.tasks_dir, exist_ok=True)
 
     def _ensure_tasks_file(self):
         """Create tasks file for user if it doesn't exist"""
-        if not os.path.exists(self.tasks_file):
-            with open(self.tasks_file, "w") as f:
-                json.dump([], f)
+        # "x" creates the file or fails if it exists, with no separate probe
+        try:
+            with open(self.tasks_file, "xb") as f:
+                f.write(jsonio.dumps([]))
+        except FileExistsError:
+            pass
 
     def _load_tasks(self):
         """
-        Load tasks from file
+        Load tasks, reading the file only when it changed since last read
+
+        The parsed list is cached and reused while the file's mtime is
+        unchanged, so repeated operations skip the file read and JSON parse.
+
+        While changes are waiting to be flushed the cache is the newer
+        copy, so it is returned without looking at the file.
 
         Returns:
-            list: List of task dictionaries
+            list: List of task dictionaries (the cached list itself)
         """
-        try:
-            with open(self.tasks_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        with self._lock:
+            if self._cache is not None and self._dirty:
+                return self._cache
+
+            try:
+                mtime = os.stat(self.tasks_file).st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+
+            if self._cache is not None and mtime == self._cache_mtime:
+                return self._cache
+
+            tasks = []
+            if mtime is not None:
+                try:
+                    with open(self.tasks_file, "rb") as f:
+                        tasks = jsonio.loads(f.read())
+                except (FileNotFoundError, json.JSONDecodeError):
+                    tasks = []
+
+            self._cache = tasks
+            self._cache_mtime = mtime
+            self._build_indexes(tasks)
+            return tasks
+
+    def _build_indexes(self, tasks):
+        """
+        Rebuild in-memory lookup structures from a freshly loaded task list
+
+        Mutating methods keep these in step incrementally afterwards.
+
+        Args:
+            tasks (list): List of task dictionaries
+        """
+        self._by_id = {task["id"]: task for task in tasks}
+        self._next_id = max(self._by_id, default=0) + 1
+        self._by_status = _new_buckets()
+        self._by_priority = _new_buckets()
+        for task in sorted(self._by_id.values(), key=itemgetter("id")):
+            _bucket_add(self._by_status, task["status"], task)
+            _bucket_add(self._by_priority, task["priority"], task)
+        self._search_blobs = {task["id"]: self._search_blob(task) for task in tasks}
+
+    def _search_blob(self, task):
+        """
+        Build the lowercased text that search_tasks matches against
+
+        Args:
+            task (dict): Task dictionary
+
+        Returns:
+            str: Lowercased title and description joined by a NUL, so a
+                keyword cannot match across the two fields
+        """
+        return f"{task['title']}\x00{task['description']}".lower()
 
     def _save_tasks(self, tasks):
         """
-        Save tasks to file
+        Record tasks as the current state and schedule a flush to file
+
+        Mutations only mark the cache dirty; a timer writes it out
+        FLUSH_DELAY seconds after the first unsaved change, so several
+        changes in quick succession cost one serialization and write.
 
         Args:
             tasks (list): List of task dictionaries to save
         """
-        with open(self.tasks_file, "w") as f:
-            json.dump(tasks, f, indent=4)
+        with self._lock:
+            self._cache = tasks
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    FLUSH_DELAY, self._flush_in_background
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """
+        Write pending changes to the tasks file, if there are any
+
+        The list is serialized to one bytes blob, written with a single
+        write to a temporary file and then renamed over the tasks file, so
+        a crash mid-save never leaves a truncated file behind. Runs from
+        the flush timer and at interpreter exit; call it directly before
+        another process or TaskManager needs to read the file.
+
+        Raises:
+            OSError: If the file could not be written; the changes stay
+                pending and are retried by the next flush
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+
+            data = jsonio.dumps(self._cache)
+            tmp_file = self.tasks_file + ".tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.tasks_file)
+
+            self._dirty = False
+            self._flush_error = None
+            self._cache_mtime = os.stat(self.tasks_file).st_mtime_ns
+
+    def _flush_in_background(self):
+        """Flush from the timer thread, keeping any error for the next call"""
+        try:
+            self.flush()
+        except OSError as e:
+            self._flush_error = e
+
+    def _save_error(self):
+        """
+        Retry a background flush that failed
+
+        Returns:
+            str or None: Error message if the tasks still cannot be saved
+        """
+        if self._flush_error is None:
+            return None
+        try:
+            self.flush()
+        except OSError as e:
+            return f"Could not save tasks: {e}"
+        return None
+
+    def close(self):
+        """
+        Flush pending changes and drop the exit hook for this manager
+
+        Raises:
+            OSError: If pending changes could not be written; the exit hook
+                is then kept so they are retried when the program exits
+        """
+        self.flush()
+        atexit.unregister(self.flush)
 
     def _get_timestamp(self):
         """
         Get current timestamp
 
+        The string only changes once a second, so it is formatted once
+        and reused for calls within the same second.
+
         Returns:
             str: Current timestamp in readable format
         """
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        sec = int(time.time())
+        if self._ts_cache[0] != sec:
+            stamp = datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S")
+            self._ts_cache = (sec, stamp)
+        return self._ts_cache[1]
 
-    def _get_next_id(self, tasks):
+    def _get_next_id(self):
         """
-        Get next available task ID
+        Allocate the next task ID
 
-        Args:
-            tasks (list): Current list of tasks
+        IDs come from a counter seeded when tasks are loaded, so an ID is
+        not handed out twice in a session even if its task is deleted.
 
         Returns:
             int: Next available ID
         """
-        if not tasks:
-            return 1
-        return max(task["id"] for task in tasks) + 1
+        if self._next_id is None:
+            self._next_id = max(self._by_id, default=0) + 1
+
+        task_id = self._next_id
+        self._next_id += 1
+        return task_id
 
+    @_locked
     def add_task(self, title, description="", priority="Medium", due_date=""):
         """
         Add a new task
@@ -98,11 +329,15 @@ class TaskManager:
         if not title or not title.strip():
             return False, "Task title cannot be empty", None
 
-        if priority not in ["Low", "Medium", "High"]:
+        if priority not in _PRIORITIES:
             priority = "Medium"
 
+        error = self._save_error()
+        if error:
+            return False, error, None
+
         tasks = self._load_tasks()
-        task_id = self._get_next_id(tasks)
+        task_id = self._get_next_id()
 
         new_task = {
             "id": task_id,
@@ -116,6 +351,10 @@ class TaskManager:
         }
 
         tasks.append(new_task)
+        self._by_id[task_id] = new_task
+        _bucket_add(self._by_status, "Pending", new_task)
+        _bucket_add(self._by_priority, priority, new_task)
+        self._search_blobs[task_id] = self._search_blob(new_task)
         self._save_tasks(tasks)
 
         return True, f"Task '{title}' added successfully!", task_id
@@ -127,7 +366,8 @@ class TaskManager:
         Returns:
             list: List of all tasks
         """
-        return self._load_tasks()
+        # Copy so callers cannot reorder or resize the cached list
+        return list(self._load_tasks())
 
     def view_task_by_id(self, task_id):
         """
@@ -139,11 +379,8 @@ class TaskManager:
         Returns:
             dict or None: Task dictionary if found, None otherwise
         """
-        tasks = self._load_tasks()
-        for task in tasks:
-            if task["id"] == task_id:
-                return task
-        return None
+        self._load_tasks()
+        return self._by_id.get(task_id)
 
     def view_tasks_by_status(self, status):
         """
@@ -155,8 +392,9 @@ class TaskManager:
         Returns:
             list: List of tasks with the specified status
         """
-        tasks = self._load_tasks()
-        return [task for task in tasks if task["status"] == status]
+        self._load_tasks()
+        ids, tasks = self._by_status.get(status, ((), ()))
+        return list(tasks)
 
     def view_tasks_by_priority(self, priority):
         """
@@ -168,9 +406,11 @@ class TaskManager:
         Returns:
             list: List of tasks with the specified priority
         """
-        tasks = self._load_tasks()
-        return [task for task in tasks if task["priority"] == priority]
+        self._load_tasks()
+        ids, tasks = self._by_priority.get(priority, ((), ()))
+        return list(tasks)
 
+    @_locked
     def update_task(self, task_id, **kwargs):
         """
         Update an existing task
@@ -182,38 +422,37 @@ class TaskManager:
         Returns:
             tuple: (success: bool, message: str)
         """
-        tasks = self._load_tasks()
-        task_found = False
-
-        for task in tasks:
-            if task["id"] == task_id:
-                task_found = True
-
-                # Update allowed fields
-                if "title" in kwargs and kwargs["title"].strip():
-                    task["title"] = kwargs["title"].strip()
-
-                if "description" in kwargs:
-                    task["description"] = kwargs["description"].strip()
-
-                if "priority" in kwargs and kwargs["priority"] in [
-                    "Low",
-                    "Medium",
-                    "High",
-                ]:
-                    task["priority"] = kwargs["priority"]
+        error = self._save_error()
+        if error:
+            return False, error
 
-                if "due_date" in kwargs:
-                    task["due_date"] = kwargs["due_date"].strip()
-
-                break
+        tasks = self._load_tasks()
+        task = self._by_id.get(task_id)
 
-        if not task_found:
+        if task is None:
             return False, f"Task with ID {task_id} not found"
 
-        self._save_tasks(tasks)
+        # Update allowed fields, ignoring invalid or unchanged values
+        old_priority = task["priority"]
+        changed = False
+        for field, clean in _UPDATABLE_FIELDS:
+            if field not in kwargs:
+                continue
+            value = clean(kwargs[field])
+            if value is not None and value != task[field]:
+                task[field] = value
+                changed = True
+
+        # Skip the full rewrite of the tasks file when nothing changed
+        if changed:
+            if task["priority"] != old_priority:
+                _bucket_remove(self._by_priority, old_priority, task)
+                _bucket_add(self._by_priority, task["priority"], task)
+            self._search_blobs[task_id] = self._search_blob(task)
+            self._save_tasks(tasks)
         return True, f"Task {task_id} updated successfully!"
 
+    @_locked
     def mark_complete(self, task_id):
         """
         Mark a task as completed
@@ -224,26 +463,28 @@ class TaskManager:
         Returns:
             tuple: (success: bool, message: str)
         """
-        tasks = self._load_tasks()
-        task_found = False
+        error = self._save_error()
+        if error:
+            return False, error
 
-        for task in tasks:
-            if task["id"] == task_id:
-                task_found = True
+        tasks = self._load_tasks()
+        task = self._by_id.get(task_id)
 
-                if task["status"] == "Completed":
-                    return False, f"Task {task_id} is already completed"
+        if task is None:
+            return False, f"Task with ID {task_id} not found"
 
-                task["status"] = "Completed"
-                task["completed_at"] = self._get_timestamp()
-                break
+        if task["status"] == "Completed":
+            return False, f"Task {task_id} is already completed"
 
-        if not task_found:
-            return False, f"Task with ID {task_id} not found"
+        _bucket_remove(self._by_status, task["status"], task)
+        _bucket_add(self._by_status, "Completed", task)
+        task["status"] = "Completed"
+        task["completed_at"] = self._get_timestamp()
 
         self._save_tasks(tasks)
         return True, f"Task {task_id} marked as completed!"
 
+    @_locked
     def mark_pending(self, task_id):
         """
         Mark a task as pending
@@ -254,26 +495,28 @@ class TaskManager:
         Returns:
             tuple: (success: bool, message: str)
         """
-        tasks = self._load_tasks()
-        task_found = False
+        error = self._save_error()
+        if error:
+            return False, error
 
-        for task in tasks:
-            if task["id"] == task_id:
-                task_found = True
+        tasks = self._load_tasks()
+        task = self._by_id.get(task_id)
 
-                if task["status"] == "Pending":
-                    return False, f"Task {task_id} is already pending"
+        if task is None:
+            return False, f"Task with ID {task_id} not found"
 
-                task["status"] = "Pending"
-                task["completed_at"] = None
-                break
+        if task["status"] == "Pending":
+            return False, f"Task {task_id} is already pending"
 
-        if not task_found:
-            return False, f"Task with ID {task_id} not found"
+        _bucket_remove(self._by_status, task["status"], task)
+        _bucket_add(self._by_status, "Pending", task)
+        task["status"] = "Pending"
+        task["completed_at"] = None
 
         self._save_tasks(tasks)
         return True, f"Task {task_id} marked as pending!"
 
+    @_locked
     def delete_task(self, task_id):
         """
         Delete a task
@@ -284,15 +527,21 @@ class TaskManager:
         Returns:
             tuple: (success: bool, message: str)
         """
-        tasks = self._load_tasks()
-        initial_count = len(tasks)
+        error = self._save_error()
+        if error:
+            return False, error
 
-        tasks = [task for task in tasks if task["id"] != task_id]
+        self._load_tasks()
 
-        if len(tasks) == initial_count:
+        task = self._by_id.pop(task_id, None)
+        if task is None:
             return False, f"Task with ID {task_id} not found"
+        _bucket_remove(self._by_status, task["status"], task)
+        _bucket_remove(self._by_priority, task["priority"], task)
+        self._search_blobs.pop(task_id, None)
 
-        self._save_tasks(tasks)
+        # The index keeps file order, so it can stand in for the list
+        self._save_tasks(list(self._by_id.values()))
         return True, f"Task {task_id} deleted successfully!"
 
     def get_task_count(self):
@@ -303,10 +552,11 @@ class TaskManager:
             dict: Dictionary with task counts
         """
         tasks = self._load_tasks()
+        # Status buckets are maintained by the mutating methods; no scan needed
         return {
             "total": len(tasks),
-            "pending": len([t for t in tasks if t["status"] == "Pending"]),
-            "completed": len([t for t in tasks if t["status"] == "Completed"]),
+            "pending": len(self._by_status["Pending"][0]),
+            "completed": len(self._by_status["Completed"][0]),
         }
 
     def search_tasks(self, keyword):
@@ -319,15 +569,11 @@ class TaskManager:
         Returns:
             list: List of matching tasks
         """
-        tasks = self._load_tasks()
+        self._load_tasks()
         keyword_lower = keyword.lower()
 
-        matching_tasks = []
-        for task in tasks:
-            if (
-                keyword_lower in task["title"].lower()
-                or keyword_lower in task["description"].lower()
-            ):
-                matching_tasks.append(task)
-
-        return matching_tasks
+        # Text is lowercased once when tasks are loaded/changed, not per query;
+        # map/compress keep the per-task test in C
+        blobs = self._search_blobs
+        hits = compress(blobs, map(contains, blobs.values(), repeat(keyword_lower)))
+        return list(map(self._by_id.__getitem__, hits))
@@ -5,7 +5,15 @@ Handles user registration, login, and credential management
 
 import os
 import json
+import hmac
 import hashlib
+from datetime import datetime
+
+import jsonio
+
+# scrypt cost parameters for stored password hashes (~16 MiB, ~50 ms)
+SCRYPT_PARAMS = {"n": 2**14, "r": 8, "p": 1}
+SALT_SIZE = 16
 
 
 class UserAuth:
@@ -19,55 +27,133 @@ class UserAuth:
             users_file (str): Path to the JSON file storing user data
         """
         self.users_file = users_file
+        self._users = None
+        self._users_mtime = None
         self._ensure_data_directory()
         self._ensure_users_file()
 
     def _ensure_data_directory(self):
         """Create data directory if it doesn't exist"""
         directory = os.path.dirname(self.users_file)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
     def _ensure_users_file(self):
         """Create users file if it doesn't exist"""
-        if not os.path.exists(self.users_file):
-            with open(self.users_file, "w") as f:
-                json.dump({}, f)
+        try:
+            with open(self.users_file, "xb") as f:
+                f.write(jsonio.dumps({}))
+        except FileExistsError:
+            pass
 
-    def _hash_password(self, password):
+    def _hash_password(self, password, salt):
         """
-        Hash password using SHA-256
+        Hash password using scrypt
 
         Args:
             password (str): Plain text password
+            salt (bytes): Per-user random salt
 
         Returns:
-            str: Hashed password
+            str: Hashed password as hex
+        """
+        return hashlib.scrypt(password.encode(), salt=salt, **SCRYPT_PARAMS).hex()
+
+    def _hash_password_sha256(self, password):
+        """
+        Hash password using unsalted SHA-256 (accounts created before scrypt)
+
+        Args:
+            password (str): Plain text password
+
+        Returns:
+            str: Hashed password as hex
         """
         return hashlib.sha256(password.encode()).hexdigest()
 
+    def _make_credentials(self, password):
+        """
+        Build the stored credential fields for a password
+
+        Args:
+            password (str): Plain text password
+
+        Returns:
+            dict: Password hash, salt and algorithm name
+        """
+        salt = os.urandom(SALT_SIZE)
+        return {
+            "password": self._hash_password(password, salt),
+            "salt": salt.hex(),
+            "algo": "scrypt",
+        }
+
+    def _verify_password(self, user, password):
+        """
+        Check a password against a stored user record
+
+        Args:
+            user (dict): Stored user record
+            password (str): Plain text password
+
+        Returns:
+            bool: True if the password matches
+        """
+        if user.get("algo") == "scrypt":
+            computed = self._hash_password(password, bytes.fromhex(user["salt"]))
+        else:
+            computed = self._hash_password_sha256(password)
+
+        # Constant-time comparison so timing does not leak matching prefixes
+        return hmac.compare_digest(user["password"], computed)
+
     def _load_users(self):
         """
-        Load users from file
+        Load users, reading the file only when it changed since last read
 
         Returns:
-            dict: Dictionary of users and their credentials
+            dict: Dictionary of users and their credentials (the cached dict)
         """
         try:
-            with open(self.users_file, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            mtime = os.stat(self.users_file).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if self._users is not None and mtime == self._users_mtime:
+            return self._users
+
+        users = {}
+        if mtime is not None:
+            try:
+                with open(self.users_file, "rb") as f:
+                    users = jsonio.loads(f.read())
+            except (FileNotFoundError, json.JSONDecodeError):
+                users = {}
+
+        self._users = users
+        self._users_mtime = mtime
+        return users
 
     def _save_users(self, users):
         """
         Save users to file
 
+        Written to a temporary file and renamed into place, as for tasks.
+
         Args:
             users (dict): Dictionary of users to save
         """
-        with open(self.users_file, "w") as f:
-            json.dump(users, f, indent=4)
+        data = jsonio.dumps(users)
+        tmp_file = self.users_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.users_file)
+
+        # Write-through: the cache only ever holds what is on disk
+        self._users = users
+        self._users_mtime = os.stat(self.users_file).st_mtime_ns
 
     def register(self, username, password):
         """
@@ -100,10 +186,14 @@ class UserAuth:
         if username in users:
             return False, "Username already exists"
 
-        # Save new user
-        users[username] = {
-            "password": self._hash_password(password),
-            "created_at": self._get_timestamp(),
+        # Save new user. Changes go into a copy: the cache is only replaced
+        # once _save_users has written it, so a failed save leaves no trace
+        users = {
+            **users,
+            username: {
+                **self._make_credentials(password),
+                "created_at": self._get_timestamp(),
+            },
         }
         self._save_users(users)
 
@@ -130,11 +220,17 @@ class UserAuth:
             return False, "Invalid username or password"
 
         # Verify password
-        if users[username]["password"] == self._hash_password(password):
-            return True, "Login successful!"
-        else:
+        user = users[username]
+        if not self._verify_password(user, password):
             return False, "Invalid username or password"
 
+        # Upgrade legacy SHA-256 hashes now that we know the password
+        if user.get("algo") != "scrypt":
+            upgraded = {**user, **self._make_credentials(password)}
+            self._save_users({**users, username: upgraded})
+
+        return True, "Login successful!"
+
     def _get_timestamp(self):
         """
         Get current timestamp
@@ -142,8 +238,6 @@ class UserAuth:
         Returns:
             str: Current timestamp in ISO format
         """
-        from datetime import datetime
-
         return datetime.now().isoformat()
 
     def user_exists(self, username):